@@ -2,22 +2,48 @@ from __future__ import annotations
 import json
 import os
 import csv
+import hashlib
 import argparse
 import random
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
 from io import StringIO, BytesIO
+from itertools import repeat
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Tuple
 
 from flask import (
     Flask, render_template, request, redirect, url_for,
-    jsonify, flash, send_file, make_response
+    flash, send_file, send_from_directory, g
 )
+from flask_caching import Cache
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 from flask_wtf.csrf import CSRFProtect, CSRFError
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback for environments without orjson
+    orjson = None
+
 # --- PDF (ReportLab) ---
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas as pdfcanvas
 from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # stdlib parser; slower but accepts the same log timestamps
+    _parse_iso = datetime.fromisoformat
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # without pypdf, PDF exports render in a single process
+    PdfReader = PdfWriter = None
 
 from utils.analyzer import analyze_text, micro_interventions
 
@@ -26,7 +52,8 @@ BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "data")
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 
-ENTRIES_PATH = os.path.join(DATA_DIR, "entries.json")
+ENTRIES_PATH = os.path.join(DATA_DIR, "entries.jsonl")
+LEGACY_ENTRIES_PATH = os.path.join(DATA_DIR, "entries.json")
 SETTINGS_PATH = os.path.join(DATA_DIR, "settings.json")
 
 QUOTES_PATH = os.path.join(ASSETS_DIR, "quotes.json")
@@ -54,48 +81,288 @@ app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
 app.config["SESSION_COOKIE_SECURE"] = False
 csrf = CSRFProtect(app)
 
+# ===== Response cache (in-process; entry-derived keys include the log stamp) =====
+# The threshold caps the entry count; PDF and API bodies are only cached up to
+# PDF_CACHE_MAX_BYTES / API_CACHE_MAX_BYTES, and /export/json has one key per log version.
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60, "CACHE_THRESHOLD": 64})
+
 
 # ---------- Helpers ----------
-def load_json(path, default):
+def _json_loads(data):
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # stdlib also accepts NaN/Infinity, which older saves may hold
+    return json.loads(data)
+
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes (non-ASCII kept as-is, like ensure_ascii=False)."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_response(data):
+    """application/json response from pre-encoded bytes with a known length."""
+    body = data if isinstance(data, bytes) else _json_dumps(data)
+    resp = app.response_class(body, mimetype="application/json")
+    resp.content_length = len(body)
+    return resp
+
+
+# Parsed JSON is cached per path and keyed by (mtime, size), so unchanged files
+# are not re-read on every request. Cached objects are shared: treat them as
+# read-only and build fresh containers on write paths.
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _file_stamp(path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it does not exist.
+
+    Size is part of the key because coarse filesystem clocks can leave mtime
+    unchanged across two quick writes (e.g. from another worker process).
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_cached(path, default, parse):
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return default
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "rb") as f:
+            data = parse(f)
     except Exception:
         return default
+    _JSON_CACHE[path] = (stamp, data)
+    return data
+
+
+def load_json(path, default):
+    return _read_cached(path, default, lambda f: _json_loads(f.read()))
+
+
+# mkstemp creates files as 0600; replacements should keep normal permissions.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(path: str, chunks):
+    """Write chunks to a temp file beside path, then swap it in with os.replace,
+    so readers see either the old file or the new one, never a partial write."""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _JSON_CACHE.pop(path, None)
 
 
 def save_json(path, data):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _atomic_write(path, (_json_dumps(data, indent=True),))
+
+
+# ---------- Content assets (loaded once; only changed via _append_to_map_list) ----------
+_QUOTES: Dict[str, List[str]] = load_json(QUOTES_PATH, {})
+_PROMPTS: List[str] = load_json(PROMPTS_PATH, [])
+_SCRIPTURES: Dict[str, List[str]] = load_json(SCRIPTURES_PATH, {})
+_WISDOM: Dict[str, List[Dict]] = load_json(WISDOM_PATH, {})
+_ASSETS_LOCK = threading.Lock()
+
+
+# ---------- Entries log (JSON Lines: one entry per line) ----------
+def _parse_jsonl(f) -> List[Dict]:
+    entries = []
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(_json_loads(line))
+        except ValueError:
+            continue  # skip torn/unparseable lines; _delete_entries keeps them on disk
+    return entries
+
+
+def _load_entries() -> List[Dict]:
+    return _read_cached(ENTRIES_PATH, [], _parse_jsonl)
+
+
+def _entries_cache_key(*parts) -> str:
+    """Response-cache key from the inputs that shape a response plus the log
+    stamp, so unrelated or reordered query args share one entry."""
+    return "|".join(map(str, (*parts, _file_stamp(ENTRIES_PATH))))
+
+
+def _append_entry(entry: Dict):
+    line = _json_dumps(entry) + b"\n"
+    with open(ENTRIES_PATH, "a+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                # Start on a fresh line so a torn tail stays the only bad line.
+                line = b"\n" + line
+        f.write(line)
+    _JSON_CACHE.pop(ENTRIES_PATH, None)
+
+
+def _write_entries(entries: List[Dict]):
+    _atomic_write(ENTRIES_PATH, (_json_dumps(e) + b"\n" for e in entries))
+
+
+def _delete_entries(ts: str) -> bool:
+    """Rewrite the log without entries whose timestamp is ts; True if any matched.
+
+    Works on the raw lines so that lines the readers skip (torn or otherwise
+    unparseable) are carried over byte for byte instead of being dropped.
+    """
+    try:
+        with open(ENTRIES_PATH, "rb") as f:
+            lines = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return False
+    kept = []
+    for line in lines:
+        try:
+            e = _json_loads(line)
+        except ValueError:
+            kept.append(line)
+            continue
+        if not (isinstance(e, dict) and (e.get("timestamp") or "").strip() == ts):
+            kept.append(line)
+    if len(kept) == len(lines):
+        return False
+    _atomic_write(ENTRIES_PATH, (line + b"\n" for line in kept))
+    return True
+
+
+def _read_legacy_entries() -> List[Dict]:
+    """Entries from the old single-array entries.json, for the one-time migration.
+
+    Raises instead of returning [] when the file exists but cannot be read:
+    the log is only created once, so an empty one would hide the history.
+    """
+    try:
+        with open(LEGACY_ENTRIES_PATH, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    try:
+        legacy = _json_loads(data)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"Cannot migrate {LEGACY_ENTRIES_PATH}: {exc}. "
+            "Repair or move the file, then restart."
+        ) from exc
+    if not isinstance(legacy, list):
+        raise RuntimeError(f"Cannot migrate {LEGACY_ENTRIES_PATH}: expected a JSON array.")
+    return legacy
+
+
+_FILES_READY = False
+_FILES_LOCK = threading.Lock()
 
 
 def ensure_files():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(ENTRIES_PATH):
-        save_json(ENTRIES_PATH, [])
-    if not os.path.exists(SETTINGS_PATH):
-        save_json(SETTINGS_PATH, {
-            "emergency_text": "If you are in immediate danger, contact local emergency services.",
-            "emergency_contact_label": "Family",
-            "emergency_contact_value": "",
-            "default_support_flavor": "secular",
-        })
-
-
-def _append_to_map_list(path: str, flavor: str, item):
-    m = load_json(path, {})
-    if flavor not in m or not isinstance(m[flavor], list):
-        m[flavor] = []
-    m[flavor].append(item)
-    save_json(path, m)
+    """Create the data dir, entries log and settings once per process."""
+    global _FILES_READY
+    if _FILES_READY:
+        return
+    with _FILES_LOCK:
+        if _FILES_READY:
+            return
+        os.makedirs(DATA_DIR, exist_ok=True)
+        if not os.path.exists(ENTRIES_PATH):
+            _write_entries(_read_legacy_entries())
+        if not os.path.exists(SETTINGS_PATH):
+            save_json(SETTINGS_PATH, {
+                "emergency_text": "If you are in immediate danger, contact local emergency services.",
+                "emergency_contact_label": "Family",
+                "emergency_contact_value": "",
+                "default_support_flavor": "secular",
+            })
+        _FILES_READY = True
+
+ensure_files()
+
+
+def _append_to_map_list(path: str, mapping: Dict[str, List], flavor: str, item):
+    """Append item under flavor in both the in-memory map and its file."""
+    with _ASSETS_LOCK:
+        current = mapping.get(flavor)
+        # Swap in a new list so concurrent readers never see a half-updated one.
+        mapping[flavor] = (list(current) if isinstance(current, list) else []) + [item]
+        save_json(path, mapping)
 
 
 def _last_entry() -> Optional[Dict]:
-    entries: List[Dict] = load_json(ENTRIES_PATH, [])
-    return entries[-1] if entries else None
+    """Newest entry, read from the tail of the log instead of parsing all of it."""
+    try:
+        with open(ENTRIES_PATH, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            tail = b""
+            while pos > 0 and b"\n" not in tail.rstrip():
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+    except OSError:
+        return None
+    line = tail.rstrip().rsplit(b"\n", 1)[-1]
+    if not line:
+        return None
+    try:
+        return _json_loads(line)
+    except ValueError:
+        # Torn last line: let the tolerant full parse pick the last good entry.
+        entries: List[Dict] = _load_entries()
+        return entries[-1] if entries else None
 
 
+def _pick(candidates: List, last=None):
+    """Random choice that avoids repeating `last` when there is an alternative."""
+    if not candidates:
+        return None
+    n = len(candidates)
+    if last and n > 1:
+        copies = candidates.count(last)
+        if copies == 1:
+            # Uniform over the other n-1 slots, without building a pool.
+            skip = candidates.index(last)
+            idx = random.randrange(n - 1)
+            return candidates[idx if idx < skip else idx + 1]
+        if copies:
+            # Added items are not deduped; exclude every copy of last.
+            pool = [c for c in candidates if c != last]
+            if pool:
+                return pool[random.randrange(len(pool))]
+    return candidates[random.randrange(n)]
+
+
+@lru_cache(maxsize=256)
 def _parse_date_yyyy_mm_dd(s: Optional[str]) -> Optional[datetime]:
     if not s:
         return None
@@ -107,15 +374,49 @@ def _parse_date_yyyy_mm_dd(s: Optional[str]) -> Optional[datetime]:
 
 def _parse_entry_ts(e: Dict) -> Optional[datetime]:
     ts = e.get("timestamp")
+    return _parse_ts(ts) if isinstance(ts, str) else None
+
+
+# Timestamps never change once written, so a reload of the log only parses
+# the strings it has not seen before.
+@lru_cache(maxsize=65536)
+def _parse_ts(ts: str) -> Optional[datetime]:
     if not ts:
         return None
     try:
-        ts = ts.replace(" ", "T")
-        return datetime.fromisoformat(ts)
+        # Entries written by this app always use "T"; older ones may not.
+        return _parse_iso(ts if "T" in ts else ts.replace(" ", "T"))
     except Exception:
         return None
 
 
+_EPOCH = datetime(1970, 1, 1)
+# (entries, epoch seconds, ascending) for the most recently filtered entries
+# list. The cached entries list is replaced whenever the log changes, so
+# identity is the key; the tuple is read and replaced whole so threads never
+# pair one list with another list's timestamps.
+_ENTRIES_TS_CACHE: Tuple[Optional[List[Dict]], List[Optional[float]], bool] = (None, [], True)
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    return (dt.replace(tzinfo=None) - _EPOCH).total_seconds()
+
+
+def _entry_timestamps(entries: List[Dict]) -> Tuple[List[Optional[float]], bool]:
+    """Epoch seconds per entry (None if unparseable) and whether they ascend."""
+    global _ENTRIES_TS_CACHE
+    cached_entries, cached_ts, cached_sorted = _ENTRIES_TS_CACHE
+    if cached_entries is entries:
+        return cached_ts, cached_sorted
+    ts: List[Optional[float]] = []
+    for e in entries:
+        dt = _parse_entry_ts(e)
+        ts.append(_epoch_seconds(dt) if dt else None)
+    in_order = None not in ts and all(a <= b for a, b in zip(ts, ts[1:]))
+    _ENTRIES_TS_CACHE = (entries, ts, in_order)
+    return ts, in_order
+
+
 def _filter_entries(entries: List[Dict], flavor: Optional[str], start: Optional[str], end: Optional[str]) -> List[Dict]:
     """Filter by flavor and inclusive date range [start, end]."""
     f = (flavor or "").strip().lower()
@@ -124,52 +425,111 @@ def _filter_entries(entries: List[Dict], flavor: Optional[str], start: Optional[
     if end_dt:
         end_dt = end_dt + timedelta(days=1) - timedelta(seconds=1)
 
-    out = []
-    for e in entries:
-        if f and f != "all" and e.get("flavor") != f:
-            continue
-        if start_dt or end_dt:
-            et = _parse_entry_ts(e)
-            if not et:
-                continue
-            if start_dt and et < start_dt:
-                continue
-            if end_dt and et > end_dt:
-                continue
-        out.append(e)
-    return out
+    rows = entries
+    if start_dt or end_dt:
+        ts, in_order = _entry_timestamps(entries)
+        lo_s = _epoch_seconds(start_dt) if start_dt else None
+        hi_s = _epoch_seconds(end_dt) if end_dt else None
+        if in_order:
+            # Entries are appended chronologically: the range is one slice.
+            lo = bisect_left(ts, lo_s) if lo_s is not None else 0
+            hi = bisect_right(ts, hi_s) if hi_s is not None else len(ts)
+            rows = entries[lo:hi]
+        else:
+            rows = [
+                e for e, t in zip(entries, ts)
+                if t is not None
+                and (lo_s is None or t >= lo_s)
+                and (hi_s is None or t <= hi_s)
+            ]
+
+    if f and f != "all":
+        return [e for e in rows if e.get("flavor") == f]
+    return list(rows)
+
+
+def _get_entries() -> List[Dict]:
+    """The entries log, loaded at most once per request."""
+    if "entries" not in g:
+        g.entries = _load_entries()
+    return g.entries
+
+
+def _get_filtered(flavor: str, start: str, end: str) -> List[Dict]:
+    """_filter_entries over _get_entries, memoized per request and filter."""
+    memo = g.setdefault("filtered", {})
+    key = (flavor, start, end)
+    if key not in memo:
+        memo[key] = _filter_entries(_get_entries(), flavor, start, end)
+    return memo[key]
 
 
 def _fmt_entry_ts(e: Dict) -> str:
-    dt = _parse_entry_ts(e)
-    return dt.strftime("%Y-%m-%d %H:%M") if dt else (e.get("timestamp", "") or "")
+    ts = e.get("timestamp", "")
+    return _fmt_ts(ts) if isinstance(ts, str) else (ts or "")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts: str) -> str:
+    dt = _parse_ts(ts)
+    return dt.strftime("%Y-%m-%d %H:%M") if dt else ts
+
+
+_EXTRA_SUPPORT = [
+    "Take 6 slow breaths: inhale 4s, exhale 6s.",
+    "Try 5-4-3-2-1 grounding.",
+    "Send one honest message to someone you trust.",
+]
+_EXTRA_SUPPORT_KEYS = [s.strip().lower() for s in _EXTRA_SUPPORT]
 
 
 # (optional) small helper to craft suggestions; falls back to micro_interventions
 def _craft_support_messages(text: str, analysis: Dict, mood: float) -> List[str]:
     base = micro_interventions(analysis) or []
-    extras = [
-        "Take 6 slow breaths: inhale 4s, exhale 6s.",
-        "Try 5-4-3-2-1 grounding.",
-        "Send one honest message to someone you trust.",
-    ]
     seen = set()
     out = []
-    for s in base + extras:
+    for s in base:
         k = (s or "").strip().lower()
         if k and k not in seen:
             seen.add(k)
             out.append(s)
-    return out[:3]
+            if len(out) == 3:
+                return out
+    for s, k in zip(_EXTRA_SUPPORT, _EXTRA_SUPPORT_KEYS):
+        if k not in seen:
+            out.append(s)
+            if len(out) == 3:
+                break
+    return out
 
 
 # ---------- Global template context ----------
-@app.context_processor
-def inject_globals():
-    return {
-        "flavor_labels": FLAVOR_LABELS,
-        "flavor_label": lambda key: FLAVOR_LABELS.get(key, key),
-    }
+def _flavor_label(key):
+    return FLAVOR_LABELS.get(key, key)
+
+
+# Registered once on the Jinja env instead of via a per-render context processor.
+app.jinja_env.globals["flavor_labels"] = FLAVOR_LABELS
+app.jinja_env.globals["flavor_label"] = _flavor_label
+app.jinja_env.filters["flavor_label"] = _flavor_label
+
+
+@lru_cache(maxsize=4096)
+def _url_for_memo(script_root: str, endpoint: str, values: Tuple) -> str:
+    return url_for(endpoint, **dict(values))
+
+
+def _cached_url_for(endpoint: str, **values) -> str:
+    """url_for for templates, memoized per mount point, endpoint and arguments."""
+    if values.get("_external"):
+        return url_for(endpoint, **values)  # depends on the request host
+    try:
+        return _url_for_memo(request.script_root, endpoint, tuple(sorted(values.items())))
+    except TypeError:  # unhashable argument (e.g. a list of values)
+        return url_for(endpoint, **values)
+
+
+app.jinja_env.globals["url_for"] = _cached_url_for
 
 
 # ---------- CSRF handler ----------
@@ -179,9 +539,15 @@ def handle_csrf_error(e):
     return redirect(url_for("index")), 302
 
 
+# Probe/utility endpoints that never render HTML or take form posts.
+_UTILITY_ENDPOINTS = frozenset({"health", "list_routes"})
+
+
 @app.after_request
 def add_no_store(resp):
     """Avoid cached HTML serving stale CSRF tokens."""
+    if request.endpoint in _UTILITY_ENDPOINTS:
+        return resp
     content_type = resp.headers.get("Content-Type", "")
     if content_type.startswith("text/html"):
         resp.headers["Cache-Control"] = "no-store, max-age=0"
@@ -193,9 +559,8 @@ def add_no_store(resp):
 # ---------- Routes ----------
 @app.route("/")
 def index():
-    ensure_files()
     settings = load_json(SETTINGS_PATH, {})
-    prompts = load_json(PROMPTS_PATH, [])
+    prompts = _PROMPTS
     prompt_text = random.choice(prompts) if isinstance(prompts, list) and prompts else "How are you feeling right now?"
     return render_template("index.html", app_name=APP_NAME, settings=settings, prompt=prompt_text)
 
@@ -207,7 +572,6 @@ def journal_get_redirect():
 
 @app.post("/journal")
 def journal():
-    ensure_files()
     text = (request.form.get("entry_text") or "").strip()
     try:
         mood = float(request.form.get("mood", "0"))
@@ -223,28 +587,22 @@ def journal():
     support = _craft_support_messages(text, analysis, mood)
 
     # optional content picks (quotes/scriptures/wisdom)
-    quotes_map = load_json(QUOTES_PATH, {})
-    scriptures_map = load_json(SCRIPTURES_PATH, {})
-    wisdom_map = load_json(WISDOM_PATH, {})
+    quotes_map = _QUOTES
+    scriptures_map = _SCRIPTURES
+    wisdom_map = _WISDOM
 
     last = _last_entry()
 
     spiritual_candidates = scriptures_map.get(flavor) or scriptures_map.get("secular") or []
-    last_spiritual = last.get("spiritual") if last else None
-    spiritual = random.choice(spiritual_candidates) if spiritual_candidates else None
-    if last_spiritual and spiritual_candidates and len(spiritual_candidates) > 1:
-        pool = [s for s in spiritual_candidates if s != last_spiritual]
-        spiritual = random.choice(pool)
+    spiritual = _pick(spiritual_candidates, last.get("spiritual") if last else None)
 
     quote_candidates = quotes_map.get(flavor) or quotes_map.get("secular") or ["You are doing the best you can."]
-    last_quote = last.get("quote") if last else None
-    quote = random.choice(quote_candidates)
-    if last_quote and len(quote_candidates) > 1:
-        pool = [q for q in quote_candidates if q != last_quote]
-        quote = random.choice(pool)
+    quote = _pick(quote_candidates, last.get("quote") if last else None)
 
     wlist = wisdom_map.get(flavor) or wisdom_map.get("secular") or []
-    wisdom = random.choice(wlist) if wlist else None
+    # Stored wisdom round-trips as the same {"text", "author"} dict, so plain
+    # equality identifies the last one.
+    wisdom = _pick(wlist, last.get("wisdom") if last else None)
 
     entry = {
         "timestamp": datetime.now().isoformat(timespec="seconds"),
@@ -258,9 +616,8 @@ def journal():
         "wisdom": wisdom
     }
 
-    entries: List[Dict] = load_json(ENTRIES_PATH, [])
-    entries.append(entry)
-    save_json(ENTRIES_PATH, entries)
+    _append_entry(entry)
+    cache.clear()
 
     return redirect(url_for("entries"))
 
@@ -268,15 +625,13 @@ def journal():
 @app.get("/entries")
 def entries():
     """Render entries page with optional filters."""
-    ensure_files()
-    all_entries: List[Dict] = load_json(ENTRIES_PATH, [])
     settings = load_json(SETTINGS_PATH, {})
 
     flavor = request.args.get("flavor", default="", type=str)
     start = request.args.get("start", default="", type=str)
     end = request.args.get("end", default="", type=str)
 
-    filtered = _filter_entries(all_entries, flavor, start, end)
+    filtered = _get_filtered(flavor, start, end)
 
     return render_template(
         "entries.html",
@@ -296,17 +651,13 @@ def delete_entry():
     Delete one journal entry identified by its timestamp string (exact match).
     Expects form field: ts = 'YYYY-MM-DDTHH:MM:SS'
     """
-    ensure_files()
     ts = (request.form.get("ts") or "").strip()
     if not ts:
         flash("Missing entry identifier.", "error")
         return redirect(url_for("entries"))
 
-    all_entries: List[Dict] = load_json(ENTRIES_PATH, [])
-    kept = [e for e in all_entries if (e.get("timestamp") or "").strip() != ts]
-
-    if len(kept) < len(all_entries):
-        save_json(ENTRIES_PATH, kept)
+    if _delete_entries(ts):
+        cache.clear()
         flash("Entry deleted.", "ok")
     else:
         flash("Entry not found.", "error")
@@ -315,162 +666,312 @@ def delete_entry():
 
 
 # ---------- Entries API (used by chart) ----------
+# Columns available via /api/entries?fields=a,b — returned as parallel arrays.
+API_COLUMNS = {
+    "timestamp": lambda e: e.get("timestamp"),
+    "flavor": lambda e: e.get("flavor"),
+    "mood_slider": lambda e: e.get("mood_slider"),
+    "mood_score": lambda e: (e.get("analysis") or {}).get("mood_score"),
+    "positive": lambda e: (e.get("analysis") or {}).get("positive"),
+    "negative": lambda e: (e.get("analysis") or {}).get("negative"),
+}
+# Only API bodies up to this size are kept in the response cache; every
+# distinct filter/limit combination gets its own entry.
+API_CACHE_MAX_BYTES = 262_144
+
+
 @app.get("/api/entries")
 def api_entries():
-    ensure_files()
-    all_entries: List[Dict] = load_json(ENTRIES_PATH, [])
-
     flavor = request.args.get("flavor", default="", type=str)
     start = request.args.get("start", default="", type=str)
     end = request.args.get("end", default="", type=str)
     limit = request.args.get("limit", type=int)
-
-    filtered = _filter_entries(all_entries, flavor, start, end)
-    if isinstance(limit, int) and limit > 0:
-        filtered = filtered[-limit:]
-
-    resp = make_response(json.dumps(filtered, ensure_ascii=False))
-    resp.mimetype = "application/json"
-    resp.headers["Cache-Control"] = "no-store, max-age=0"
+    fields = [f for f in request.args.get("fields", default="", type=str).split(",") if f in API_COLUMNS]
+
+    # Same log version + same filters => same body; answer revalidations
+    # with 304 before loading or filtering anything.
+    key = f"{_file_stamp(ENTRIES_PATH)}|{flavor}|{start}|{end}|{limit}|{','.join(fields)}"
+    etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+        resp.set_etag(etag, weak=True)
+        resp.headers["Cache-Control"] = "no-cache"
+        return resp
+
+    body = cache.get(f"api_entries|{etag}")
+    if body is None:
+        filtered = _get_filtered(flavor, start, end)
+        if isinstance(limit, int) and limit > 0:
+            filtered = filtered[-limit:]
+        if fields:
+            # Column-oriented payload: only what the caller asked for.
+            body = _json_dumps({f: [API_COLUMNS[f](e) for e in filtered] for f in fields})
+        else:
+            body = _json_dumps(filtered)
+        if len(body) <= API_CACHE_MAX_BYTES:
+            cache.set(f"api_entries|{etag}", body)
+
+    resp = _json_response(body)
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
     return resp
 
 
 # ---------- Export pages & files ----------
 @app.get("/export")
 def export_page():
-    ensure_files()
     return render_template("export.html", app_name=APP_NAME)
 
 
 @app.get("/export/json")
+@cache.cached(make_cache_key=lambda *args, **kwargs: _entries_cache_key("export_json"))
 def export_json():
-    ensure_files()
-    entries = load_json(ENTRIES_PATH, [])
+    # Re-encode the parsed log so a torn line is dropped here just as
+    # everywhere else; the parse is cached and the response is too.
+    lines = [_json_dumps(e) for e in _load_entries()]
     return app.response_class(
-        response=json.dumps(entries, ensure_ascii=False, indent=2),
+        response=b"[\n" + b",\n".join(lines) + b"\n]" if lines else b"[]",
         mimetype="application/json"
     )
 
 
+# Rows per chunk of the streamed CSV export.
+CSV_STREAM_BATCH = 256
+
+
 @app.get("/export/csv")
 def export_csv():
-    ensure_files()
-    entries = load_json(ENTRIES_PATH, [])
+    entries = _load_entries()
     fieldnames = ["timestamp", "mood_slider", "flavor", "mood_score", "positive", "negative", "text"]
 
-    def row(e):
-        a = e.get("analysis", {}) or {}
-        return {
-            "timestamp": e.get("timestamp", ""),
-            "mood_slider": e.get("mood_slider", ""),
-            "flavor": e.get("flavor", ""),
-            "mood_score": a.get("mood_score", ""),
-            "positive": a.get("positive", ""),
-            "negative": a.get("negative", ""),
-            "text": (e.get("text", "") or "").replace("\n", " ").strip(),
-        }
-
-    sio = StringIO()
-    writer = csv.DictWriter(sio, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-    writer.writeheader()
-    for e in entries:
-        writer.writerow(row(e))
-    return app.response_class(response=sio.getvalue(), mimetype="text/csv")
+    def generate():
+        # Rows are flushed in batches so memory stays flat and the download
+        # starts before the whole log has been formatted.
+        sio = StringIO()
+        writer = csv.writer(sio, quoting=csv.QUOTE_ALL)
+        writer.writerow(fieldnames)
+        for i, e in enumerate(entries, 1):
+            a = e.get("analysis", {}) or {}
+            writer.writerow((
+                e.get("timestamp", ""),
+                e.get("mood_slider", ""),
+                e.get("flavor", ""),
+                a.get("mood_score", ""),
+                a.get("positive", ""),
+                a.get("negative", ""),
+                (e.get("text", "") or "").replace("\n", " ").strip(),
+            ))
+            if i % CSV_STREAM_BATCH == 0:
+                yield sio.getvalue()
+                sio.seek(0)
+                sio.truncate()
+        yield sio.getvalue()
+
+    return app.response_class(generate(), mimetype="text/csv")
+
+
+# ---------- PDF helpers ----------
+PDF_MARGIN = 18 * mm
+PDF_TITLE = f"{APP_NAME} — Entries Export"
+# Every parallel chunk gets at least this many entries; below that, process
+# start-up costs more than it saves.
+PDF_PARALLEL_MIN_ENTRIES = 200
+# Workers are started from a clean server process, never forked from the
+# (possibly multi-threaded) request process, which can deadlock the child.
+_PDF_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+# Exports up to this size are rendered in memory; larger ones spill to a temp file.
+PDF_IN_MEMORY_MAX_BYTES = 1_048_576
+# Only exports up to this size are kept in the response cache.
+PDF_CACHE_MAX_BYTES = 262_144
 
 
-@app.get("/export/pdf")
-def export_pdf():
-    ensure_files()
-    all_entries: List[Dict] = load_json(ENTRIES_PATH, [])
-    flavor = request.args.get("flavor", default="", type=str)
-    start = request.args.get("start", default="", type=str)
-    end = request.args.get("end", default="", type=str)
+def _new_pdf_canvas(buffer):
+    c = pdfcanvas.Canvas(buffer, pagesize=A4)
+    c.setTitle(f"{APP_NAME} Export")
+    c.setAuthor(APP_NAME)
+    return c
+
+
+def _draw_pdf_header(c, y: float, subtitle: str) -> float:
+    """Draw the title block at y and return the y below it (leaves Helvetica 10 set)."""
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(PDF_MARGIN, y, PDF_TITLE)
+    y -= 14
+    c.setFont("Helvetica", 10)
+    c.drawString(PDF_MARGIN, y, subtitle)
+    y -= 8
+    c.setLineWidth(0.5)
+    c.line(PDF_MARGIN, y, A4[0] - PDF_MARGIN, y)
+    return y - 10
+
+
+def _glyph_widths(font: str) -> Dict[str, float]:
+    """Advance width (in ems) of every character the font's WinAnsi encoding covers."""
+    widths = getFont(font).widths
+    table: Dict[str, float] = {}
+    for code in range(256):
+        if code < 0x20 or code == 0x7F:
+            continue  # control codes: leave them to the stringWidth fallback
+        try:
+            ch = bytes((code,)).decode("cp1252")
+        except UnicodeDecodeError:
+            continue
+        table[ch] = widths[code] / 1000.0
+    return table
 
-    entries = _filter_entries(all_entries, flavor, start, end)
-    entries.sort(key=lambda e: (_parse_entry_ts(e) or datetime.min))
 
+# Standard fonts have no kerning, so a string's width is the sum of its
+# characters' advances. Characters outside the tables are measured once.
+_GLYPH_WIDTHS: Dict[str, Dict[str, float]] = {
+    font: _glyph_widths(font) for font in ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+}
+
+
+def _text_width(s: str, font: str = "Helvetica", size: int = 10) -> float:
+    table = _GLYPH_WIDTHS.get(font)
+    if table is None:
+        table = _GLYPH_WIDTHS[font] = {}
+    total = 0.0
+    for ch in s:
+        w = table.get(ch)
+        if w is None:
+            w = table[ch] = stringWidth(ch, font, 1)
+        total += w
+    return total * size
+
+
+@lru_cache(maxsize=2048)
+def _wrap_text(text: str, max_w: float, font: str = "Helvetica", size: int = 10) -> Tuple[str, ...]:
+    """Greedy word wrap to max_w points; overlong words are broken per character.
+
+    Cached because quotes, scriptures and wisdom repeat across entries.
+    """
+    if not text:
+        return ()
+    max_w += 1e-6  # absorb float drift from summing per-char widths
+    space_w = _text_width(" ", font, size)
+    out: List[str] = []
+    cur, cur_w = "", 0.0
+    for w in text.replace("\r", "").split():
+        w_w = _text_width(w, font, size)
+        if cur and cur_w + space_w + w_w <= max_w:
+            cur += " " + w
+            cur_w += space_w + w_w
+            continue
+        if cur:
+            out.append(cur)
+        if w_w > max_w:
+            buf, buf_w = "", 0.0
+            for ch in w:
+                ch_w = _text_width(ch, font, size)
+                if buf_w + ch_w <= max_w:
+                    buf += ch
+                    buf_w += ch_w
+                else:
+                    if buf:
+                        out.append(buf)
+                    buf, buf_w = ch, ch_w
+            cur, cur_w = buf, buf_w
+        else:
+            cur, cur_w = w, w_w
+    if cur:
+        out.append(cur)
+    return tuple(out)
+
+
+@lru_cache(maxsize=32)
+def _empty_pdf(subtitle: str) -> bytes:
+    """The "no entries" export for one filter subtitle, rendered only once."""
     buffer = BytesIO()
-    page_w, page_h = A4
-    margin = 18 * mm
-    c = pdfcanvas.Canvas(buffer, pagesize=A4)
+    c = _new_pdf_canvas(buffer)
+    y = _draw_pdf_header(c, A4[1] - PDF_MARGIN, subtitle)
+    c.setFont("Helvetica-Oblique", 10)
+    c.drawString(PDF_MARGIN, y, "No entries available for the selected filters.")
+    c.showPage()
+    c.save()
+    return buffer.getvalue()
 
-    title = f"{APP_NAME} — Entries Export"
-    subtitle_parts = []
-    if flavor:
-        subtitle_parts.append(f"Flavor: {FLAVOR_LABELS.get(flavor, flavor)}")
-    if start:
-        subtitle_parts.append(f"Start: {start}")
-    if end:
-        subtitle_parts.append(f"End: {end}")
-    subtitle = " | ".join(subtitle_parts) if subtitle_parts else "All entries"
+
+_empty_pdf("All entries")
+
+
+def _send_pdf(buffer, filename: str):
+    size = buffer.seek(0, os.SEEK_END)
+    buffer.seek(0)
+    resp = send_file(buffer, mimetype="application/pdf", as_attachment=True,
+                     download_name=filename, conditional=False)
+    # werkzeug can only size paths and BytesIO, and without a size it skips
+    # Range handling; give it the length so spooled exports get 206/416 too.
+    resp.content_length = size
+    try:
+        return resp.make_conditional(request.environ, accept_ranges=True, complete_length=size)
+    except RequestedRangeNotSatisfiable:
+        buffer.close()
+        raise
+
+
+def _render_pdf(entries: List[Dict], subtitle: str, out):
+    """Render entries (already filtered and ordered) as a PDF into `out`."""
+    page_w, page_h = A4
+    margin = PDF_MARGIN
+    c = _new_pdf_canvas(out)
 
     y = page_h - margin
-    c.setTitle(f"{APP_NAME} Export")
-    c.setAuthor(APP_NAME)
+    # All entry text goes through text objects, which carry their own fonts,
+    # so the canvas font state is never consulted.
 
     def draw_header():
         nonlocal y
-        c.setFont("Helvetica-Bold", 14)
-        c.drawString(margin, y, title)
-        y -= 14
-        c.setFont("Helvetica", 10)
-        c.drawString(margin, y, subtitle)
-        y -= 8
-        c.setLineWidth(0.5)
-        c.line(margin, y, page_w - margin, y)
-        y -= 10
+        y = _draw_pdf_header(c, y, subtitle)
+
+    min_y = margin + 20
 
     def ensure_space(lines_needed: int, line_height: int = 12):
         nonlocal y
-        min_y = margin + 20
         if y - (lines_needed * line_height) < min_y:
             c.showPage()
             y = page_h - margin
             draw_header()
 
-    def wrap(text: str, max_w: float, font="Helvetica", size=10) -> List[str]:
-        if not text:
-            return []
-        words = text.replace("\r", "").split()
-        out: List[str] = []
-        cur = ""
-        for w in words:
-            cand = w if not cur else (cur + " " + w)
-            if c.stringWidth(cand, font, size) <= max_w:
-                cur = cand
-            else:
-                if cur:
-                    out.append(cur)
-                if c.stringWidth(w, font, size) > max_w:
-                    buf = ""
-                    for ch in w:
-                        if c.stringWidth(buf + ch, font, size) <= max_w:
-                            buf += ch
-                        else:
-                            if buf:
-                                out.append(buf)
-                            buf = ch
-                    cur = buf
-                else:
-                    cur = w
-        if cur:
-            out.append(cur)
-        return out
+    def draw_lines(lines, label: str = "", tail: str = "", font: str = "Helvetica", size: int = 10, leading: int = 12):
+        """Emit an italic label, the lines and an italic tail through one text
+        object, flushing it at page breaks (only the body lines break)."""
+        nonlocal y
+        t = c.beginText(margin, y)
+        if label:
+            t.setFont("Helvetica-Oblique", 10, 12)
+            t.textLine(label)
+            y -= 12
+        t.setFont(font, size, leading)
+        for line in lines:
+            if y - leading < min_y:
+                c.drawText(t)
+                ensure_space(1, leading)
+                t = c.beginText(margin, y)
+                t.setFont(font, size, leading)
+            t.textLine(line)
+            y -= leading
+        if tail:
+            t.setFont("Helvetica-Oblique", 10, 12)
+            t.textLine(tail)
+            y -= 12
+        c.drawText(t)
 
-    draw_header()
+    max_w = page_w - 2 * margin
 
-    if not entries:
-        c.setFont("Helvetica-Oblique", 10)
-        c.drawString(margin, y, "No entries available for the selected filters.")
-        c.showPage()
-        c.save()
-        buffer.seek(0)
-        return send_file(buffer, mimetype="application/pdf", as_attachment=True, download_name="entries.pdf")
+    def block(label: str, content: str, tail: str = ""):
+        draw_lines(_wrap_text(content, max_w), label=f"{label}:", tail=tail)
 
-    max_w = page_w - 2 * margin
+    draw_header()
+
+    labels_get = FLAVOR_LABELS.get
     for e in entries:
+        ensure_space(3)
         ts = _fmt_entry_ts(e)
-        flavor_label = FLAVOR_LABELS.get(e.get("flavor", ""), e.get("flavor", ""))
+        flavor_key = e.get("flavor", "")
+        flavor_label = labels_get(flavor_key, flavor_key)
         mood_slider = e.get("mood_slider", "")
 
         a = e.get("analysis", {}) or {}
@@ -485,51 +986,23 @@ def export_pdf():
         wisdom_text = wisdom.get("text")
         wisdom_author = wisdom.get("author")
 
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(margin, y, f"{ts}   •   {flavor_label}   •   Mood: {mood_slider}")
-        y -= 13
-
-        c.setFont("Helvetica", 10)
-        c.drawString(margin, y, f"Mood score: {mood_score}   (+{pos} / -{neg})")
-        y -= 12
+        # Both heading lines in one text object; ensure_space(3) covers them.
+        t = c.beginText(margin, y)
+        t.setFont("Helvetica-Bold", 11, 13)
+        t.textLine(f"{ts}   •   {flavor_label}   •   Mood: {mood_slider}")
+        t.setFont("Helvetica", 10, 12)
+        t.textLine(f"Mood score: {mood_score}   (+{pos} / -{neg})")
+        c.drawText(t)
+        y -= 25
 
         if text:
-            c.setFont("Helvetica-Oblique", 10)
-            c.drawString(margin, y, "Your words:")
-            y -= 12
-            c.setFont("Helvetica", 10)
-            for line in wrap(text, max_w):
-                c.drawString(margin, y, line)
-                y -= 12
-
-        def block(label: str, content: Optional[str], italic=False):
-            nonlocal y
-            if not content:
-                return
-            c.setFont("Helvetica-Oblique", 10 if italic else 10)
-            c.drawString(margin, y, f"{label}:")
-            y -= 12
-            c.setFont("Helvetica", 10)
-            for line in wrap(content if label != "Wisdom" else f"“{content}”", max_w):
-                c.drawString(margin, y, line)
-                y -= 12
-
+            block("Your words", text)
         if quote:
-            block("Supportive note", quote, italic=True)
+            block("Supportive note", quote)
         if spiritual:
-            block("Spiritual note", spiritual, italic=True)
+            block("Spiritual note", spiritual)
         if wisdom_text:
-            c.setFont("Helvetica-Oblique", 10)
-            c.drawString(margin, y, "Wisdom:")
-            y -= 12
-            c.setFont("Helvetica", 10)
-            for line in wrap(f"“{wisdom_text}”", max_w):
-                c.drawString(margin, y, line)
-                y -= 12
-            if wisdom_author:
-                c.setFont("Helvetica-Oblique", 10)
-                c.drawString(margin, y, f"— {wisdom_author}")
-                y -= 12
+            block("Wisdom", f"“{wisdom_text}”", f"— {wisdom_author}" if wisdom_author else "")
 
         y -= 6
         c.setLineWidth(0.3)
@@ -540,7 +1013,32 @@ def export_pdf():
 
     c.showPage()
     c.save()
-    buffer.seek(0)
+
+
+def _render_pdf_chunk(entries: List[Dict], subtitle: str) -> bytes:
+    buffer = BytesIO()
+    _render_pdf(entries, subtitle, buffer)
+    return buffer.getvalue()
+
+
+def _render_pdf_parallel(entries: List[Dict], subtitle: str, out, workers: int):
+    """Render contiguous chunks in worker processes and concatenate the pages."""
+    size = -(-len(entries) // workers)
+    chunks = [entries[i:i + size] for i in range(0, len(entries), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=_PDF_MP_CONTEXT) as pool:
+        parts = list(pool.map(_render_pdf_chunk, chunks, repeat(subtitle)))
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(BytesIO(part)))
+    writer.add_metadata({"/Title": f"{APP_NAME} Export", "/Author": APP_NAME})
+    writer.write(out)
+
+
+@app.get("/export/pdf")
+def export_pdf():
+    flavor = request.args.get("flavor", default="", type=str)
+    start = request.args.get("start", default="", type=str)
+    end = request.args.get("end", default="", type=str)
 
     parts = ["entries"]
     if flavor:
@@ -551,26 +1049,63 @@ def export_pdf():
         parts.append(end)
     filename = "-".join(parts) + ".pdf"
 
-    return send_file(buffer, mimetype="application/pdf", as_attachment=True, download_name=filename)
+    cache_key = _entries_cache_key("export_pdf", flavor, start, end)
+    cached_pdf = cache.get(cache_key)
+    if cached_pdf is not None:
+        return _send_pdf(BytesIO(cached_pdf), filename)
+
+    all_entries = _get_entries()
+    entries = _get_filtered(flavor, start, end)
+    ts, in_order = _entry_timestamps(all_entries)
+    if not in_order:
+        # Only a hand-edited log or a clock change breaks append order;
+        # sort on the cached epochs instead of re-parsing timestamps.
+        epoch_by_id = {id(e): (t if t is not None else float("-inf")) for e, t in zip(all_entries, ts)}
+        entries.sort(key=lambda e: epoch_by_id[id(e)])
+
+    subtitle_parts = []
+    if flavor:
+        subtitle_parts.append(f"Flavor: {FLAVOR_LABELS.get(flavor, flavor)}")
+    if start:
+        subtitle_parts.append(f"Start: {start}")
+    if end:
+        subtitle_parts.append(f"End: {end}")
+    subtitle = " | ".join(subtitle_parts) if subtitle_parts else "All entries"
+
+    if not entries:
+        return _send_pdf(BytesIO(_empty_pdf(subtitle)), "entries.pdf")
+
+    # Small exports stay in memory; large ones spill to a temp file.
+    buffer = tempfile.SpooledTemporaryFile(max_size=PDF_IN_MEMORY_MAX_BYTES, mode="w+b")
+    workers = min(os.cpu_count() or 1, len(entries) // PDF_PARALLEL_MIN_ENTRIES)
+    if PdfWriter is not None and workers > 1:
+        _render_pdf_parallel(entries, subtitle, buffer, workers)
+    else:
+        _render_pdf(entries, subtitle, buffer)
+
+    if buffer.tell() <= PDF_CACHE_MAX_BYTES:
+        buffer.seek(0)
+        cache.set(cache_key, buffer.read())
+    return _send_pdf(buffer, filename)
 
 
 # ---------- Root-served PWA files ----------
 @app.get("/sw.js")
 def service_worker():
-    path = os.path.join(app.static_folder, "sw.js")
-    return send_file(path, mimetype="application/javascript")
+    # Browsers must re-check the worker script so updates roll out promptly.
+    return send_from_directory(app.static_folder, "sw.js",
+                               mimetype="application/javascript", max_age=0)
 
 
 @app.get("/manifest.webmanifest")
 def webmanifest():
-    path = os.path.join(app.static_folder, "manifest.webmanifest")
-    return send_file(path, mimetype="application/manifest+json")
+    return send_from_directory(app.static_folder, "manifest.webmanifest",
+                               mimetype="application/manifest+json", max_age=86400)
 
 
 # ---------- Settings / Admin ----------
 @app.post("/settings", endpoint="update_settings")
 def update_settings():
-    ensure_files()
     data = {
         "emergency_text": request.form.get("emergency_text", ""),
         "emergency_contact_label": request.form.get("emergency_contact_label", ""),
@@ -584,47 +1119,47 @@ def update_settings():
 
 @app.route("/add_wisdom", methods=["POST"], endpoint="add_wisdom")
 def add_wisdom():
-    ensure_files()
     flavor = (request.form.get("wisdom_flavor", "secular") or "secular").strip()
     text = (request.form.get("wisdom_text", "") or "").strip()
     author = (request.form.get("wisdom_author", "") or "Unknown").strip()
     if not text:
         flash("Please provide wisdom text.", "error")
         return redirect(url_for("index"))
-    _append_to_map_list(WISDOM_PATH, flavor, {"text": text, "author": author})
+    _append_to_map_list(WISDOM_PATH, _WISDOM, flavor, {"text": text, "author": author})
     flash("Wisdom quote added.", "ok")
     return redirect(url_for("index"))
 
 
 @app.route("/add_scripture", methods=["POST"], endpoint="add_scripture")
 def add_scripture():
-    ensure_files()
     flavor = (request.form.get("scripture_flavor", "secular") or "secular").strip()
     text = (request.form.get("scripture_text", "") or "").strip()
     if not text:
         flash("Please provide scripture text.", "error")
         return redirect(url_for("index"))
-    _append_to_map_list(SCRIPTURES_PATH, flavor, text)
+    _append_to_map_list(SCRIPTURES_PATH, _SCRIPTURES, flavor, text)
     flash("Scripture added.", "ok")
     return redirect(url_for("index"))
 
 
 # Utilities
 @app.get("/_routes")
+@cache.cached(timeout=0)
 def list_routes():
-    return jsonify(sorted([r.endpoint for r in app.url_map.iter_rules()]))
+    return _json_response(sorted([r.endpoint for r in app.url_map.iter_rules()]))
 
 
 @app.get("/health")
 def health():
-    return jsonify({"ok": True, "time": datetime.now().isoformat(timespec="seconds")})
+    return _json_response({"ok": True, "time": datetime.now().isoformat(timespec="seconds")})
 
 
 # ---------- Main ----------
 if __name__ == "__main__":
-    ensure_files()
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "5050")))
     parser.add_argument("--host", type=str, default=os.getenv("HOST", "0.0.0.0"))
     args = parser.parse_args()
-    app.run(debug=True, use_reloader=False, host=args.host, port=args.port)
+    # Development server; set DEV=1 for the debugger. Use wsgi.py in production.
+    debug = os.getenv("DEV", "").strip().lower() in ("1", "true", "yes")
+    app.run(debug=debug, use_reloader=False, host=args.host, port=args.port)
@@ -0,0 +1,17 @@
+"""Gunicorn settings: gunicorn -c gunicorn_conf.py wsgi:app"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5050')}"
+
+# Quotes, scriptures, wisdom and the response cache live in process memory,
+# so additions made through one worker are not seen by others. Default to a
+# single worker and get concurrency from threads; raise WEB_CONCURRENCY only
+# if that staleness is acceptable.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Threads rather than gevent: PDF exports fan out to a process pool, which
+# does not mix with monkey-patched workers, and handler I/O releases the GIL.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", str(2 * multiprocessing.cpu_count() + 1)))
+# Large PDF exports can take a while to render.
+timeout = 120
@@ -1,32 +1,49 @@
 from __future__ import annotations
 import re
+import string
 from typing import Dict, Tuple, List, Union
 
 # --- Lexicons (demo) ---
-POSITIVE = {
+POSITIVE = frozenset({
     "calm","peace","relief","grateful","gratitude","hope","okay","better","progress",
     "rest","proud","joy","happy","content","support","breathe","breathing"
-}
-NEGATIVE = {
+})
+NEGATIVE = frozenset({
     "sad","down","tired","exhausted","anxious","anxiety","panic","angry","mad","lonely",
     "burnout","burned","stress","stressed","worry","worried","overwhelmed","depressed",
     "cry","crying","fear","scared","hopeless","worthless"
-}
+})
 
 # Risk/crisis phrases (non-exhaustive)
-CRISIS = {
+CRISIS = frozenset({
     "hopeless","no way out","end it","suicide","kill myself","want to die","self harm","hurt myself",
     "bunuh diri","menyakiti diri","putus asa","tidak ada harapan"
-}
-
-STRESS = {"stress","stressed","overwhelm","overwhelmed","deadline","burnout","exhausted"}
-SADNESS = {"sad","down","blue","cry","crying","empty","hopeless","worthless","depressed"}
-ANGER = {"angry","mad","furious","irritated","annoyed"}
-LONELY = {"lonely","alone","isolated","left out"}
-ANXIETY = {"anxious","anxiety","panic","scared","fear","khawatir","cemas"}
+})
+
+STRESS = frozenset({"stress","stressed","overwhelm","overwhelmed","deadline","burnout","exhausted"})
+SADNESS = frozenset({"sad","down","blue","cry","crying","empty","hopeless","worthless","depressed"})
+ANGER = frozenset({"angry","mad","furious","irritated","annoyed"})
+LONELY = frozenset({"lonely","alone","isolated","left out"})
+ANXIETY = frozenset({"anxious","anxiety","panic","scared","fear","khawatir","cemas"})
+
+_TOKEN_RE = re.compile(r"[a-zA-Z']+|[\u00C0-\u024F\u1E00-\u1EFF]+")
+# Crisis phrases matched on the raw text in one pass; a space in a phrase
+# matches any run of non-token characters, as it did on the joined tokens.
+_NON_TOKEN = r"[^a-zA-Z'\u00C0-\u024F\u1E00-\u1EFF]+"
+_CRISIS_RE = re.compile("|".join(
+    _NON_TOKEN.join(map(re.escape, phrase.split()))
+    for phrase in sorted(CRISIS, key=len, reverse=True)
+))
+# ASCII fast path: every char except a-z and apostrophe becomes a separator
+_ASCII_SEPARATORS = str.maketrans({
+    c: " " for c in map(chr, range(128)) if c not in string.ascii_lowercase + "'"
+})
 
 def tokenize(text: str) -> List[str]:
-    return re.findall(r"[a-zA-Z']+|[\u00C0-\u024F\u1E00-\u1EFF]+", text.lower())
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_ASCII_SEPARATORS).split()
+    return _TOKEN_RE.findall(text)
 
 def _nice_number(x: float) -> Union[int, float]:
     """
@@ -44,8 +61,10 @@ def _nice_number(x: float) -> Union[int, float]:
 
 def analyze_text(text: str) -> Dict:
     toks = tokenize(text)
-    pos = sum(1 for t in toks if t in POSITIVE)
-    neg = sum(1 for t in toks if t in NEGATIVE)
+    tok_set = set(toks)
+    # Counts include repeated words, so only skip the scan when nothing matches
+    pos = 0 if tok_set.isdisjoint(POSITIVE) else sum(1 for t in toks if t in POSITIVE)
+    neg = 0 if tok_set.isdisjoint(NEGATIVE) else sum(1 for t in toks if t in NEGATIVE)
 
     # Mood score in [-1, 1] with clean formatting (no trailing zeros like -1.00)
     if pos + neg > 0:
@@ -55,14 +74,13 @@ def analyze_text(text: str) -> Dict:
         mood_score = 0  # exact int zero
 
     # Signals
-    joined = " ".join(toks)
     signals = {
-        "stress": any(t in STRESS for t in toks),
-        "sadness": any(t in SADNESS for t in toks),
-        "anger": any(t in ANGER for t in toks),
-        "lonely": any(t in LONELY for t in toks),
-        "anxiety": any(t in ANXIETY for t in toks),
-        "crisis": any(phrase in joined for phrase in CRISIS),
+        "stress": not tok_set.isdisjoint(STRESS),
+        "sadness": not tok_set.isdisjoint(SADNESS),
+        "anger": not tok_set.isdisjoint(ANGER),
+        "lonely": not tok_set.isdisjoint(LONELY),
+        "anxiety": not tok_set.isdisjoint(ANXIETY),
+        "crisis": bool(_CRISIS_RE.search(text.lower())),
     }
     return {
         "tokens": toks,
@@ -142,9 +160,5 @@ def micro_interventions(analysis: Dict) -> List[str]:
         outs.append(_behavioral_activation())
         outs.append(_self_compassion())
 
-    # Keep unique and concise
-    uniq = []
-    for s in outs:
-        if s not in uniq:
-            uniq.append(s)
-    return uniq[:4]
+    # Keep unique (first occurrence wins) and concise
+    return list(dict.fromkeys(outs))[:4]
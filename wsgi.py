@@ -0,0 +1,7 @@
+"""WSGI entry point for production servers.
+
+    gunicorn -c gunicorn_conf.py wsgi:app
+"""
+from app import app
+
+__all__ = ["app"]